@@ -129,6 +129,7 @@ def _update_sources(
     db: AbstractDatabase,
     update_merged: bool,
     from_local: bool,
+    validate: bool = False,
 ) -> None:
     """Update selected normalizer sources.
 
@@ -137,11 +138,12 @@ def _update_sources(
     :param update_merged: if true, retain processed records to use in updating merged
         records
     :param from_local: if true, use locally available data only
+    :param validate: if true, validate each record against the disease schema
     """
     processed_ids = []
     for n in sources:
         delete_time = _delete_source(n, db)
-        _load_source(n, db, delete_time, processed_ids, from_local)
+        _load_source(n, db, delete_time, processed_ids, from_local, validate)
 
     if update_merged:
         _load_merge(db, set(processed_ids))
@@ -173,6 +175,7 @@ def _load_source(
     delete_time: float,
     processed_ids: list[str],
     from_local: bool,
+    validate: bool = False,
 ) -> None:
     """Load individual source data.
 
@@ -181,6 +184,7 @@ def _load_source(
     :param delete_time: time taken (in seconds) to run deletion
     :param processed_ids: in-progress list of processed disease IDs
     :param from_local: if true, use locally available data
+    :param validate: if true, validate each record against the disease schema
     """
     msg = f"Loading {n.value}..."
     click.echo(msg)
@@ -197,7 +201,7 @@ def _load_source(
         click.get_current_context().exit()
     SourceClass = eval(n.value)  # noqa: N806 S307 PGH001
 
-    source = SourceClass(database=db, silent=False)
+    source = SourceClass(database=db, silent=False, validate=validate)
     processed_ids += source.perform_etl(use_existing=from_local)
     end_load = timer()
     load_time = end_load - start_load
@@ -272,6 +276,12 @@ def _load_merge(db: AbstractDatabase, processed_ids: set[str]) -> None:
     default=False,
     help="Use most recent local source data instead of fetching latest versions.",
 )
+@click.option(
+    "--validate",
+    is_flag=True,
+    default=False,
+    help="Validate every source record against the disease schema (slow).",
+)
 def update_db(
     sources: str,
     aws_instance: bool,
@@ -279,6 +289,7 @@ def update_db(
     update_all: bool,
     update_merged: bool,
     from_local: bool,
+    validate: bool,
 ) -> None:
     """Update selected normalizer source(s) in the disease database.
 
@@ -289,12 +300,13 @@ def update_db(
     :param update_all: if true, update all sources (ignore `normalizer` parameter)
     :param update_merged: if true, update normalized records
     :param from_local: if true, use locally available data only
+    :param validate: if true, validate each source record against the disease schema
     """  # noqa: D301
     _configure_logging()
     db = create_db(db_url, aws_instance)
 
     if update_all:
-        _update_sources(list(SourceName), db, update_merged, from_local)
+        _update_sources(list(SourceName), db, update_merged, from_local, validate)
     elif not sources:
         if update_merged:
             _load_merge(db, set())
@@ -319,7 +331,7 @@ def update_db(
             raise Exception(msg)
 
         sources_to_update = {SourceName(SOURCES_LOWER_LOOKUP[s]) for s in sources_split}
-        _update_sources(sources_to_update, db, update_merged, from_local)
+        _update_sources(sources_to_update, db, update_merged, from_local, validate)
     _logger.info("Database update successful.")
 
 
@@ -7,7 +7,7 @@ database connection.
 
 import abc
 import sys
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Mapping
 from enum import Enum
 from os import environ
 from pathlib import Path
@@ -129,6 +129,21 @@ class AbstractDatabase(abc.ABC):
         :return: complete record, if match is found; None otherwise
         """
 
+    @abc.abstractmethod
+    def get_records_by_ids(self, concept_ids: Iterable[str]) -> dict[str, dict]:
+        """Fetch identity records for many concept IDs at once.
+
+        Lookups are case-sensitive: an ID only matches a record whose concept ID is
+        spelled identically, as with the default (``case_sensitive=True``) behavior of
+        :py:meth:`get_record_by_id`.
+
+        :param concept_ids: concept IDs for records
+        :return: mapping from provided concept IDs to complete records. IDs without an
+            exactly matching record are omitted.
+        :raise DatabaseReadException: if DB client requires separate read calls and
+            encounters a failure in the process
+        """
+
     @abc.abstractmethod
     def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
         """Retrieve concept IDs for records matching the user's query. Other methods
@@ -190,6 +205,13 @@ class AbstractDatabase(abc.ABC):
         :param record: merged record to add
         """
 
+    @abc.abstractmethod
+    def add_merged_records(self, records: Iterable[dict]) -> None:
+        """Add many merged records to database at once.
+
+        :param records: merged records to add
+        """
+
     @abc.abstractmethod
     def update_merge_ref(self, concept_id: str, merge_ref: Any) -> None:  # noqa: ANN401
         """Update the merged record reference of an individual record to a new value.
@@ -199,6 +221,15 @@ class AbstractDatabase(abc.ABC):
         :raise DatabaseWriteException: if attempting to update non-existent record
         """
 
+    @abc.abstractmethod
+    def update_merge_refs(self, merge_refs: Mapping[str, Any]) -> None:
+        """Update the merged record references of many individual records at once.
+
+        :param merge_refs: mapping from concept IDs of records to update to their new
+            ref values
+        :raise DatabaseWriteException: if attempting to update non-existent records
+        """
+
     @abc.abstractmethod
     def delete_normalized_concepts(self) -> None:
         """Remove merged records from the database. Use when performing a new update
@@ -3,7 +3,9 @@
 import atexit
 import logging
 import sys
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
 from pathlib import Path
 from typing import Any
@@ -11,6 +13,7 @@ from typing import Any
 import boto3
 import click
 from boto3.dynamodb.conditions import Attr, Equals, Key
+from boto3.dynamodb.table import BatchWriter
 from botocore.exceptions import ClientError
 
 from disease import ITEM_TYPES, PREFIX_LOOKUP
@@ -35,6 +38,9 @@ from disease.schemas import (
 
 _logger = logging.getLogger()
 
+# BatchGetItem calls per chunk of keys before giving up on unprocessed keys
+_MAX_BATCH_GET_ATTEMPTS = 8
+
 
 class DynamoDbDatabase(AbstractDatabase):
     """Disease Normalizer database client for DynamoDB."""
@@ -91,10 +97,23 @@ class DynamoDbDatabase(AbstractDatabase):
             self.initialize_db()
 
         self.diseases = self.dynamodb.Table(self.disease_table)
-        self.batch = self.diseases.batch_writer()
+        self.batch = self._create_batch_writer()
         self._cached_sources: dict[str, SourceMeta] = {}
         atexit.register(self.close_connection)
 
+    def _create_batch_writer(self) -> BatchWriter:
+        """Create batch writer for record uploads.
+
+        Pending writes are deduplicated on the table's primary key, so repeated writes
+        of the same record within a batch are collapsed before they're sent (and don't
+        trip DynamoDB's duplicate-key validation).
+
+        :return: batch writer for disease table
+        """
+        return self.diseases.batch_writer(
+            overwrite_by_pkeys=["label_and_type", "concept_id"]
+        )
+
     def list_tables(self) -> list[str]:
         """Return names of tables in database.
 
@@ -277,6 +296,49 @@ class DynamoDbDatabase(AbstractDatabase):
         except (KeyError, IndexError):  # record doesn't exist
             return None
 
+    def get_records_by_ids(self, concept_ids: Iterable[str]) -> dict[str, dict]:
+        """Fetch identity records for many concept IDs at once.
+
+        Keys are requested in ``BatchGetItem`` calls of up to 100 keys each, and keys
+        left unprocessed (e.g. due to throttling) are retried with exponential backoff.
+        Lookups are case-sensitive, since the concept ID is the table's sort key.
+
+        :param concept_ids: concept IDs for records
+        :return: mapping from provided concept IDs to complete records. IDs without a
+            matching record are omitted.
+        :raise DatabaseReadException: if a batch read fails, or if keys are still
+            unprocessed after the maximum number of attempts
+        """
+        records = {}
+        unique_ids = list(dict.fromkeys(concept_ids))
+        for i in range(0, len(unique_ids), 100):
+            keys = [
+                {
+                    "label_and_type": f"{concept_id.lower()}##{RecordType.IDENTITY.value}",
+                    "concept_id": concept_id,
+                }
+                for concept_id in unique_ids[i : i + 100]
+            ]
+            request_items = {self.disease_table: {"Keys": keys}}
+            for attempt in range(_MAX_BATCH_GET_ATTEMPTS):
+                if attempt:
+                    # back off before retrying keys that exceeded throughput
+                    time.sleep(min(0.05 * 2 ** (attempt - 1), 5))
+                try:
+                    response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                except ClientError as e:
+                    raise DatabaseReadException(e) from e
+                for record in response["Responses"].get(self.disease_table, []):
+                    del record["label_and_type"]
+                    records[record["concept_id"]] = record
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    break
+            else:
+                msg = f"Unable to read {len(request_items[self.disease_table]['Keys'])} records after {_MAX_BATCH_GET_ATTEMPTS} attempts"
+                raise DatabaseReadException(msg)
+        return records
+
     def get_refs_by_type(self, search_term: str, ref_type: RefType) -> list[str]:
         """Retrieve concept IDs for records matching the user's query. Other methods
         are responsible for actually retrieving full records.
@@ -369,9 +431,12 @@ class DynamoDbDatabase(AbstractDatabase):
     def add_source_metadata(self, src_name: SourceName, meta: SourceMeta) -> None:
         """Add new source metadata entry.
 
+        The entry is queued on the same batch writer as the source's records, so it's
+        sent with them rather than in a request of its own. Write errors therefore
+        surface when the batch is flushed, not here.
+
         :param src_name: name of source
         :param meta: known source attributes
-        :raise DatabaseWriteException: if write fails
         """
         src_name_value = src_name.value
         metadata_item = meta.model_dump()
@@ -379,10 +444,7 @@ class DynamoDbDatabase(AbstractDatabase):
         metadata_item["label_and_type"] = f"{str(src_name_value).lower()}##source"
         metadata_item["concept_id"] = f"source:{str(src_name_value).lower()}"
         metadata_item["item_type"] = "source"
-        try:
-            self.diseases.put_item(Item=metadata_item)
-        except ClientError as e:
-            raise DatabaseWriteException(e) from e
+        self.batch.put_item(Item=metadata_item)
 
     def add_record(self, record: dict, src_name: SourceName) -> None:
         """Add new record to database.
@@ -391,8 +453,9 @@ class DynamoDbDatabase(AbstractDatabase):
         :param SourceName src_name: name of source for record
         """
         concept_id = record["concept_id"]
+        concept_id_lower = concept_id.lower()
         record["src_name"] = src_name.value
-        label_and_type = f"{concept_id.lower()}##identity"
+        label_and_type = f"{concept_id_lower}##identity"
         record["label_and_type"] = label_and_type
         record["item_type"] = "identity"
         try:
@@ -413,9 +476,7 @@ class DynamoDbDatabase(AbstractDatabase):
                 else:
                     items = {item.lower() for item in value}
                 for item in items:
-                    self._add_ref_record(
-                        item, record["concept_id"], item_type, src_name
-                    )
+                    self._add_ref_record(item, concept_id_lower, item_type, src_name)
 
     def add_merged_record(self, record: dict) -> None:
         """Add merged record to database.
@@ -437,21 +498,35 @@ class DynamoDbDatabase(AbstractDatabase):
                 e.response["Error"]["Message"],
             )
 
+    def add_merged_records(self, records: Iterable[dict]) -> None:
+        """Add many merged records to database at once.
+
+        Puts are already coalesced into ``BatchWriteItem`` requests by the batch
+        writer, so this just queues each record.
+
+        :param records: merged records to add
+        """
+        for record in records:
+            self.add_merged_record(record)
+
     def _add_ref_record(
         self, term: str, concept_id: str, ref_type: str, src_name: SourceName
     ) -> None:
         """Add auxiliary/reference record to database.
 
-        :param str term: referent term
-        :param str concept_id: concept ID to refer to
+        Callers are responsible for lowercasing, which they've usually already done
+        while deduplicating terms.
+
+        :param str term: lowercased referent term
+        :param str concept_id: lowercased concept ID to refer to
         :param str ref_type: one of {'alias', 'label', 'xref',
             'associated_with'}
         :param src_name: name of source for record
         """
-        label_and_type = f"{term.lower()}##{ref_type}"
+        label_and_type = f"{term}##{ref_type}"
         record = {
             "label_and_type": label_and_type,
-            "concept_id": concept_id.lower(),
+            "concept_id": concept_id,
             "src_name": src_name.value,
             "item_type": ref_type,
         }
@@ -474,12 +549,15 @@ class DynamoDbDatabase(AbstractDatabase):
         :raise DatabaseWriteException: if attempting to update non-existent record
         """
         label_and_type = f"{concept_id.lower()}##identity"
-        key = {"label_and_type": label_and_type, "concept_id": concept_id}
+        key = {"label_and_type": {"S": label_and_type}, "concept_id": {"S": concept_id}}
         update_expression = "set merge_ref=:r"
-        update_values = {":r": merge_ref.lower()}
+        update_values = {":r": {"S": merge_ref.lower()}}
         condition_expression = "attribute_exists(label_and_type)"
         try:
-            self.diseases.update_item(
+            # use the low-level client rather than the table resource, because only
+            # the former is thread-safe (see `update_merge_refs()`)
+            self.dynamodb_client.update_item(
+                TableName=self.disease_table,
                 Key=key,
                 UpdateExpression=update_expression,
                 ExpressionAttributeValues=update_values,
@@ -495,6 +573,31 @@ class DynamoDbDatabase(AbstractDatabase):
                 e.response["Error"]["Message"],
             )
 
+    def update_merge_refs(self, merge_refs: Mapping[str, Any]) -> None:
+        """Update the merged record references of many individual records at once.
+
+        DynamoDB doesn't support ``UpdateItem`` requests in batch writes, so updates
+        are instead issued concurrently from a small thread pool.
+
+        :param merge_refs: mapping from concept IDs of records to update to their new
+            ref values
+        :raise DatabaseWriteException: if attempting to update non-existent records
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                concept_id: executor.submit(self.update_merge_ref, concept_id, ref)
+                for concept_id, ref in merge_refs.items()
+            }
+        missing_ids = []
+        for concept_id, future in futures.items():
+            try:
+                future.result()
+            except DatabaseWriteException:
+                missing_ids.append(concept_id)
+        if missing_ids:
+            msg = f"No such records exist for concept IDs: {missing_ids}"
+            raise DatabaseWriteException(msg)
+
     def delete_normalized_concepts(self) -> None:
         """Remove merged records from the database. Use when performing a new update
         of normalized data.
@@ -563,7 +666,7 @@ class DynamoDbDatabase(AbstractDatabase):
     def complete_write_transaction(self) -> None:
         """Conclude transaction or batch writing if relevant."""
         self.batch.__exit__(*sys.exc_info())
-        self.batch = self.diseases.batch_writer()
+        self.batch = self._create_batch_writer()
 
     def close_connection(self) -> None:
         """Perform any manual connection closure procedures if necessary."""
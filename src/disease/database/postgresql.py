@@ -4,9 +4,10 @@ import atexit
 import datetime
 import logging
 import os
+import shutil
 import tarfile
 import tempfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Mapping
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -18,6 +19,8 @@ from psycopg.errors import (
     UndefinedTable,
     UniqueViolation,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from disease.database import AbstractDatabase, DatabaseException, DatabaseWriteException
 from disease.schemas import (
@@ -394,6 +397,37 @@ class PostgresDatabase(AbstractDatabase):
             return self._get_merged_record(concept_id)
         return self._get_record(concept_id)
 
+    _records_query = (
+        b"SELECT * FROM record_lookup_view WHERE lower(concept_id) = ANY(%s);"
+    )
+
+    def get_records_by_ids(self, concept_ids: Iterable[str]) -> dict[str, dict]:
+        """Fetch identity records for many concept IDs at once.
+
+        Candidates are found through the case-insensitive concept ID index, and then
+        only exact (case-sensitive) matches are kept, as on DynamoDB. Note that this
+        method used to return records for IDs in any casing here; callers that need
+        that should use :py:meth:`get_record_by_id`, which is always case-insensitive
+        on this backend.
+
+        :param concept_ids: concept IDs for records
+        :return: mapping from provided concept IDs to complete records. IDs without an
+            exactly matching record are omitted.
+        """
+        concept_ids = list(concept_ids)
+        with self.conn.cursor() as cur:
+            cur.execute(self._records_query, [[c.lower() for c in concept_ids]])
+            results = cur.fetchall()
+        records = {}
+        for result in results:
+            record = self._format_source_record(result)
+            records[record["concept_id"]] = record
+        return {
+            concept_id: records[concept_id]
+            for concept_id in concept_ids
+            if concept_id in records
+        }
+
     _ref_types_query: ClassVar[dict] = {
         RefType.LABEL: b"SELECT concept_id FROM disease_labels WHERE lower(label) = %s;",
         RefType.ALIASES: b"SELECT concept_id FROM disease_aliases WHERE lower(alias) = %s;",
@@ -565,12 +599,15 @@ class PostgresDatabase(AbstractDatabase):
                     ],
                 )
                 cur.execute(self._insert_label_query, [record["label"], concept_id])
-                for a in record.get("aliases", []):
-                    cur.execute(self._insert_alias_query, [a, concept_id])
-                for x in record.get("xrefs", []):
-                    cur.execute(self._insert_xref_query, [x, concept_id])
-                for a in record.get("associated_with", []):
-                    cur.execute(self._insert_assoc_query, [a, concept_id])
+                # executemany pipelines each list's inserts into one round trip
+                for field, query in (
+                    ("aliases", self._insert_alias_query),
+                    ("xrefs", self._insert_xref_query),
+                    ("associated_with", self._insert_assoc_query),
+                ):
+                    values = record.get(field)
+                    if values:
+                        cur.executemany(query, [[v, concept_id] for v in values])
                 self.conn.commit()
             except UniqueViolation:
                 _logger.error("Record with ID %s already exists", concept_id)
@@ -603,6 +640,29 @@ class PostgresDatabase(AbstractDatabase):
             )
             self.conn.commit()
 
+    def add_merged_records(self, records: Iterable[dict]) -> None:
+        """Add many merged records to database at once.
+
+        :param records: merged records to add
+        """
+        with self.conn.cursor() as cur:
+            cur.executemany(
+                self._add_merged_record_query,
+                [
+                    [
+                        record["concept_id"],
+                        record["label"],
+                        record.get("aliases"),
+                        record.get("associated_with"),
+                        record.get("xrefs"),
+                        record.get("pediatric_disease"),
+                        record.get("oncologic_disease"),
+                    ]
+                    for record in records
+                ],
+            )
+            self.conn.commit()
+
     _update_merge_ref_query = b"""
     UPDATE disease_concepts
     SET merge_ref = %(merge_ref)s
@@ -629,6 +689,28 @@ class PostgresDatabase(AbstractDatabase):
             msg = f"No such record exists for primary key {concept_id}"
             raise DatabaseWriteException(msg)
 
+    def update_merge_refs(self, merge_refs: Mapping[str, Any]) -> None:
+        """Update the merged record references of many individual records at once.
+
+        :param merge_refs: mapping from concept IDs of records to update to their new
+            ref values
+        :raise DatabaseWriteException: if attempting to update non-existent records
+        """
+        with self.conn.cursor() as cur:
+            cur.executemany(
+                self._update_merge_ref_query,
+                [
+                    {"merge_ref": merge_ref, "concept_id": concept_id}
+                    for concept_id, merge_ref in merge_refs.items()
+                ],
+            )
+            row_count = cur.rowcount
+            self.conn.commit()
+
+        if row_count < len(merge_refs):
+            msg = f"Only {row_count} of {len(merge_refs)} records to update exist"
+            raise DatabaseWriteException(msg)
+
     def delete_normalized_concepts(self) -> None:
         """Remove merged records from the database. Use when performing a new update
         of normalized data.
@@ -737,21 +819,30 @@ class PostgresDatabase(AbstractDatabase):
         with tempfile.TemporaryDirectory() as tempdir:
             tempdir_path = Path(tempdir)
             temp_tarfile = tempdir_path / "disease_norm_latest.tar.gz"
-            with requests.get(url, stream=True, timeout=30) as r:
+            # reuse one connection across redirects, and retry transient failures
+            session = requests.Session()
+            retries = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            )
+            session.mount("https://", HTTPAdapter(max_retries=retries))
+            session.mount("http://", HTTPAdapter(max_retries=retries))
+            with session, session.get(url, stream=True, timeout=(5, 60)) as r:
                 try:
                     r.raise_for_status()
                 except requests.HTTPError as e:
                     msg = f"Unable to retrieve PostgreSQL dump file from {url}"
                     raise DatabaseException(msg) from e
+                r.raw.decode_content = True
                 with temp_tarfile.open("wb") as h:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            h.write(chunk)
-            tar = tarfile.open(temp_tarfile, "r:gz")
-            tar_dump_file = next(
-                f for f in tar.getmembers() if f.name.startswith("disease_norm_")
-            )
-            tar.extractall(path=tempdir_path, members=[tar_dump_file])  # noqa: S202 RUF100
+                    shutil.copyfileobj(r.raw, h, length=1 << 20)
+            with tarfile.open(temp_tarfile, "r:gz") as tar:
+                tar_dump_file = next(
+                    f for f in tar.getmembers() if f.name.startswith("disease_norm_")
+                )
+                tar.extractall(path=tempdir_path, members=[tar_dump_file])  # noqa: S202 RUF100
             dump_file = tempdir_path / tar_dump_file.name
 
             if self.conn.info.password:
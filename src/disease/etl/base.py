@@ -5,10 +5,11 @@ Generally, users shouldn't ever have to work directly with the classes contained
 
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from pathlib import Path
 
 import click
-from owlready2.rdflib_store import TripleLiteRDFlibGraph as RDFGraph
+import owlready2 as owl
 from wags_tails import CustomData, DataSource, DoData, MondoData, NcitData, OncoTreeData
 
 from disease import ITEM_TYPES, SOURCES_FOR_MERGE
@@ -24,6 +25,27 @@ DATA_DISPATCH = {
 
 _logger = logging.getLogger(__name__)
 
+OBO_IN_OWL = "http://www.geneontology.org/formats/oboInOwl#"
+
+# records with more distinct (case-insensitive) aliases than this don't store any
+MAX_ALIASES = 20
+
+
+def _exceeds_alias_limit(aliases: list[str]) -> bool:
+    """Check whether aliases exceed the limit, stopping as soon as it's passed.
+
+    :param aliases: case-sensitively deduplicated aliases
+    :return: True if more than ``MAX_ALIASES`` aliases remain after lowercasing
+    """
+    if len(aliases) <= MAX_ALIASES:
+        return False
+    seen = set()
+    for alias in aliases:
+        seen.add(alias.lower())
+        if len(seen) > MAX_ALIASES:
+            return True
+    return False
+
 
 class Base(ABC):
     """The ETL base class."""
@@ -33,14 +55,18 @@ class Base(ABC):
         database: AbstractDatabase,
         data_path: Path | None = None,
         silent: bool = True,
+        validate: bool = False,
     ) -> None:
         """Extract from sources.
 
         :param database: database client
         :param data_path: location of data directory
         :param silent: if True, don't print ETL results to console
+        :param validate: if True, check every disease record against the ``Disease``
+            schema before loading. Useful when debugging a source, but slow.
         """
         self._silent = silent
+        self._validate = validate
         self._src_name = SourceName(self.__class__.__name__)
         self._data_source: NcitData | OncoTreeData | MondoData | DoData | CustomData = (
             self._get_data_handler(data_path)
@@ -94,25 +120,25 @@ class Base(ABC):
 
     def _load_disease(self, disease: dict) -> None:
         """Load individual disease record."""
-        _ = Disease(**disease)
+        if self._validate:
+            Disease.model_validate(disease)
         concept_id = disease["concept_id"]
 
         for attr_type in ITEM_TYPES:
-            if attr_type in disease:
-                value = disease[attr_type]
-                if value is not None and value != []:
-                    if isinstance(value, str):
-                        items = [value.lower()]
-                    else:
-                        disease[attr_type] = list(set(value))
-                        items = {item.lower() for item in value}
-                        if (attr_type == "aliases") and (len(items) > 20):
-                            _logger.debug("%s has > 20 aliases.", concept_id)
-                            del disease[attr_type]
-                            continue
-
-                else:
+            if attr_type not in disease:
+                continue
+            value = disease[attr_type]
+            if isinstance(value, str):
+                continue
+            if not value:
+                del disease[attr_type]
+            else:
+                unique_values = list(dict.fromkeys(value))
+                if attr_type == "aliases" and _exceeds_alias_limit(unique_values):
+                    _logger.debug("%s has > %s aliases.", concept_id, MAX_ALIASES)
                     del disease[attr_type]
+                else:
+                    disease[attr_type] = unique_values
 
         for field in ("pediatric_disease", "oncologic_disease"):
             if field in disease and disease[field] is None:
@@ -126,34 +152,88 @@ class Base(ABC):
 class OWLBase(Base):
     """Base class for sources that use OWL files."""
 
-    def _get_subclasses(self, uri: str, graph: RDFGraph) -> set[str]:
+    _world: owl.World | None = None
+
+    def perform_etl(self, use_existing: bool = False) -> list:
+        """Public-facing method to begin ETL procedures on given data.
+
+        :param use_existing: if True, use local data instead of retrieving most recent
+            version
+        :return: List of concept IDs to be added to merge generation.
+        """
+        try:
+            return super().perform_etl(use_existing)
+        finally:
+            if self._world is not None:
+                self._world.close()
+                self._world = None
+
+    def _load_ontology(self) -> owl.Ontology:
+        """Load source ontology into its own owlready2 world.
+
+        The world is backed by an SQLite quadstore saved next to the data file, so
+        later runs against the same (unmodified) file read the already-parsed triples
+        instead of re-parsing the OWL XML.
+
+        owlready2 registers the file under its absolute URI, so a store that was built
+        from another copy of the file (e.g. after the data directory was moved) would
+        otherwise gain a second copy of every triple. Such stores are discarded and
+        rebuilt. Stores left behind by older data versions aren't removed.
+
+        :return: loaded ontology
+        """
+        store = self._data_file.with_suffix(".sqlite3")
+        uri = self._data_file.absolute().as_uri()
+        self._world = owl.World(filename=str(store))
+        ontology = self._world.get_ontology(uri)
+        if not ontology.graph.get_last_update_time() and any(
+            onto.graph.get_last_update_time()
+            for onto in self._world.ontologies.values()
+        ):
+            _logger.info("Rebuilding quadstore %s loaded from another location", store)
+            self._world.close()
+            store.unlink()
+            self._world = owl.World(filename=str(store))
+            ontology = self._world.get_ontology(uri)
+        ontology.load(reload_if_newer=True)
+        self._world.save()
+        return ontology
+
+    def _get_subclasses(self, uri: str) -> set[str]:
         """Retrieve URIs for all terms that are subclasses of given URI.
 
+        The ``rdfs:subClassOf*`` path is run by owlready2's native SPARQL engine,
+        which compiles it to a recursive SQL query against the quadstore. Unlike
+        ``ThingClass.descendants()``, this doesn't pull in classes that are only
+        related through ``owl:equivalentClass``.
+
         :param uri: URI for class
-        :param graph: RDFLib graph of ontology default world
-        :return: Set of URIs (strings) for all subclasses of `uri`
+        :return: Set of URIs (strings) for all subclasses of `uri`, including `uri`
         """
         query = f"""
-            SELECT ?c WHERE {{
-                ?c rdfs:subClassOf* <{uri}>
+            SELECT DISTINCT ?c WHERE {{
+                ?c rdfs:subClassOf* <{uri}> .
             }}
             """
-        return {item.c.toPython() for item in graph.query(query)}
+        return {
+            entity.iri
+            for (entity,) in self._world.sparql(query)
+            if hasattr(entity, "iri")  # skip blank nodes
+        }
+
+    def _get_property_values(self, prop: str) -> dict[str, list]:
+        """Retrieve every value of a property in a single query.
 
-    def _get_by_property_value(
-        self, prop: str, value: str, graph: RDFGraph
-    ) -> set[str]:
-        """Get all classes with given value for a specific property.
+        Reading attributes off of individual owlready2 classes costs a quadstore lookup
+        per class and property, so sources that need the same few properties for every
+        class should fetch them in bulk instead.
 
         :param prop: property URI
-        :param value: property value
-        :param graph: RDFLib graph of ontology default world
-        :return: Set of URIs (as strings) matching given property/value
+        :return: property values, keyed by URI of the class they belong to
         """
-        query = f"""
-            SELECT ?c WHERE {{
-                ?c <{prop}>
-                "{value}"
-            }}
-            """
-        return {item.c.toPython() for item in graph.query(query)}
+        values = defaultdict(list)
+        query = f"SELECT DISTINCT ?c ?v WHERE {{ ?c <{prop}> ?v . }}"
+        for entity, value in self._world.sparql(query):
+            if hasattr(entity, "iri"):  # skip blank nodes
+                values[entity.iri].append(value)
+        return values
@@ -1,26 +1,40 @@
 """Get Human Disease Ontology data."""
 
-import owlready2 as owl
+from types import MappingProxyType
+
 from tqdm import tqdm
 
 from disease import PREFIX_LOOKUP
-from disease.etl.base import OWLBase
+from disease.etl.base import OBO_IN_OWL, OWLBase
 from disease.schemas import NamespacePrefix, SourceMeta
 
-DO_PREFIX_LOOKUP = {
-    "EFO": NamespacePrefix.EFO.value,
-    "GARD": NamespacePrefix.GARD.value,
-    "ICDO": NamespacePrefix.ICDO.value,
-    "MESH": NamespacePrefix.MESH.value,
-    "NCI": NamespacePrefix.NCIT.value,
-    "ORDO": NamespacePrefix.ORPHANET.value,
-    "UMLS_CUI": NamespacePrefix.UMLS.value,
-    "ICD9CM": NamespacePrefix.ICD9CM.value,
-    "ICD10CM": NamespacePrefix.ICD10CM.value,
-    "MIM": NamespacePrefix.OMIM.value,
-    "KEGG": NamespacePrefix.KEGG.value,
-    "MEDDRA": NamespacePrefix.MEDDRA.value,
-}
+DO_PREFIX_LOOKUP = MappingProxyType(
+    {
+        "EFO": NamespacePrefix.EFO.value,
+        "GARD": NamespacePrefix.GARD.value,
+        "ICDO": NamespacePrefix.ICDO.value,
+        "MESH": NamespacePrefix.MESH.value,
+        "NCI": NamespacePrefix.NCIT.value,
+        "ORDO": NamespacePrefix.ORPHANET.value,
+        "UMLS_CUI": NamespacePrefix.UMLS.value,
+        "ICD9CM": NamespacePrefix.ICD9CM.value,
+        "ICD10CM": NamespacePrefix.ICD10CM.value,
+        "MIM": NamespacePrefix.OMIM.value,
+        "KEGG": NamespacePrefix.KEGG.value,
+        "MEDDRA": NamespacePrefix.MEDDRA.value,
+    }
+)
+
+# raw DO prefix -> (normalized prefix, whether it's a normalizable source prefix)
+DO_XREF_DISPATCH = MappingProxyType(
+    {
+        raw: (normed, normed.lower() in PREFIX_LOOKUP)
+        for raw, normed in DO_PREFIX_LOOKUP.items()
+    }
+)
+
+RDFS_LABEL = "http://www.w3.org/2000/01/rdf-schema#label"
+OWL_DEPRECATED = "http://www.w3.org/2002/07/owl#deprecated"
 
 
 class DO(OWLBase):
@@ -42,46 +56,55 @@ class DO(OWLBase):
         )
         self._database.add_source_metadata(self._src_name, metadata)
 
+    def _get_disease_uris(self) -> set[str]:
+        """Get URIs for all subclasses of the DO disease root.
+
+        :return: Set of URIs (strings) for all disease classes
+        """
+        return self._get_subclasses("http://purl.obolibrary.org/obo/DOID_4")
+
     def _transform_data(self) -> None:
         """Transform source data and send to loading method."""
-        do = owl.get_ontology(self._data_file.absolute().as_uri()).load()
-        disease_uri = "http://purl.obolibrary.org/obo/DOID_4"
-        diseases = self._get_subclasses(
-            disease_uri, owl.default_world.as_rdflib_graph()
-        )
+        self._load_ontology()
+        deprecated = {
+            uri
+            for uri, values in self._get_property_values(OWL_DEPRECATED).items()
+            if any(values)
+        }
+        diseases = self._get_disease_uris() - deprecated
+        labels = self._get_property_values(RDFS_LABEL)
+        synonyms = self._get_property_values(OBO_IN_OWL + "hasExactSynonym")
+        db_xrefs = self._get_property_values(OBO_IN_OWL + "hasDbXref")
+        # classes are processed serially: owlready2's quadstore isn't thread-safe, and
+        # DB writes are already buffered into batches by the database backend
         for uri in tqdm(diseases, ncols=80, disable=self._silent):
-            disease_class = do.search(iri=uri)[0]
-            if disease_class.deprecated:
-                continue
-
             concept_id = f"{NamespacePrefix.DO.value}:{uri.split('_')[-1]}"
-            label = disease_class.label[0]
+            label = labels[uri][0]
 
-            synonyms = disease_class.hasExactSynonym
-            aliases = list({s for s in synonyms if s != label}) if synonyms else []
+            aliases = set(synonyms.get(uri, []))
+            aliases.discard(label)
 
             xrefs = []
             associated_with = []
-            db_associated_with = set(disease_class.hasDbXref)
+            db_associated_with = set(db_xrefs.get(uri, []))
             for xref in db_associated_with:
                 prefix, id_no = xref.split(":", 1)
-                normed_prefix = DO_PREFIX_LOOKUP.get(prefix)
-                if normed_prefix:
-                    xref_no = f"{normed_prefix}:{id_no}"
-                    if normed_prefix.lower() in PREFIX_LOOKUP:
-                        if normed_prefix == NamespacePrefix.OMIM and id_no.startswith(
-                            "PS"
-                        ):
-                            associated_with.append(xref_no)
-                        else:
-                            xrefs.append(xref_no)
-                    else:
-                        associated_with.append(xref_no)
+                dispatch = DO_XREF_DISPATCH.get(prefix)
+                if not dispatch:
+                    continue
+                normed_prefix, is_xref = dispatch
+                xref_no = f"{normed_prefix}:{id_no}"
+                if is_xref and not (
+                    normed_prefix == NamespacePrefix.OMIM and id_no.startswith("PS")
+                ):
+                    xrefs.append(xref_no)
+                else:
+                    associated_with.append(xref_no)
 
             disease = {
                 "concept_id": concept_id,
                 "label": label,
-                "aliases": aliases,
+                "aliases": list(aliases),
                 "xrefs": xrefs,
                 "associated_with": associated_with,
             }
@@ -7,10 +7,13 @@ from timeit import default_timer as timer
 from tqdm import tqdm
 
 from disease.database.database import AbstractDatabase
-from disease.schemas import SourcePriority
+from disease.schemas import SourceName, SourcePriority
 
 _logger = logging.getLogger(__name__)
 
+# stored source name (e.g. "NCIt") -> merge priority rank
+_SOURCE_RANKS = {src.value: SourcePriority[src.name].value for src in SourceName}
+
 
 class Merge:
     """Manage construction of record mergers for normalization."""
@@ -36,21 +39,20 @@ class Merge:
         # build groups
         _logger.info("Generating record ID sets from %s records", len(record_ids))
         start = timer()
+        records = self._database.get_records_by_ids(record_ids)
         for concept_id in tqdm(record_ids, ncols=80, disable=self._silent):
-            try:
-                record = self._database.get_record_by_id(concept_id)
-            except AttributeError:
-                _logger.error(
-                    "`create_merged_concepts` received invalid concept ID: %s",
-                    concept_id,
-                )
-                continue
+            record = records.get(concept_id)
             if not record:
                 _logger.error("generate_merged_concepts couldn't find %s", concept_id)
                 continue
             xrefs = record.get("xrefs", None)
             group = {*xrefs, concept_id} if xrefs else {concept_id}
             self._groups.append((concept_id, group))
+        # fetch remaining group members once, rather than once per group they're in
+        grouped_ids = set().union(*(group for _, group in self._groups))
+        missing_ids = grouped_ids - records.keys()
+        if missing_ids:
+            records.update(self._database.get_records_by_ids(missing_ids))
         end = timer()
         self._database.complete_write_transaction()
         _logger.debug("Built record ID sets in %s seconds", end - start)
@@ -58,77 +60,95 @@ class Merge:
         # build merged concepts
         _logger.info("Creating merged records and updating database...")
         start = timer()
-        for record_id, group in tqdm(self._groups, ncols=80, disable=self._silent):
-            try:
-                merged_record, merged_ids = self._generate_merged_record(group)
-            except AttributeError:
-                _logger.error(
-                    "`create_merged_concepts` received invalid group: %s for concept %s",
-                    group,
-                    record_id,
-                )
-                continue
-            self._database.add_merged_record(merged_record)
+        # a concept can be an xref of more than one seed record: visit groups in seed
+        # priority order so that the highest-priority seed's merge ref always wins
+        self._groups.sort(key=lambda group: self._record_order(records[group[0]]))
+        # groups whose top-ranked member is the same concept share one merged record,
+        # so that every concept ID is written once and lists all concepts referring
+        # to it
+        merged_groups = {}  # merged concept ID -> IDs of all groups it is built from
+        for record_id, group in self._groups:
+            group_ids = []
+            for concept_id in group:
+                if concept_id in records:
+                    group_ids.append(concept_id)
+                else:
+                    _logger.error(
+                        "create_merged_concepts could not retrieve record for %s in group for %s",
+                        concept_id,
+                        record_id,
+                    )
+            merge_ref = min(group_ids, key=lambda i: self._record_order(records[i]))
+            merged_groups.setdefault(merge_ref, set()).update(group_ids)
+
+        merged_records = []
+        merge_refs = {}
+        for group in tqdm(merged_groups.values(), ncols=80, disable=self._silent):
+            merged_record, merged_ids = self._generate_merged_record(
+                [records[concept_id] for concept_id in group]
+            )
+            merged_records.append(merged_record)
             merge_ref = merged_record["concept_id"]
 
             for concept_id in merged_ids:
-                self._database.update_merge_ref(concept_id, merge_ref)
+                merge_refs.setdefault(concept_id, merge_ref)
+        self._database.add_merged_records(merged_records)
+        self._database.update_merge_refs(merge_refs)
         self._database.complete_write_transaction()
         end = timer()
         _logger.info("merged concept generation successful.")
         _logger.debug("Generated and added concepts in %s seconds", end - start)
 
-    def _generate_merged_record(self, record_id_set: set[str]) -> tuple[dict, list]:
-        """Generate merged record from provided concept ID group.
+    @staticmethod
+    def _record_order(record: dict) -> tuple:
+        """Provide priority values of concepts for comparison.
+
+        :param record: source record
+        :return: source priority rank and concept ID, lowest first
+        """
+        return _SOURCE_RANKS[record["src_name"]], record["concept_id"]
+
+    def _generate_merged_record(self, records: list[dict]) -> tuple[dict, list]:
+        """Generate merged record from provided concept group.
         Where attributes are sets, they should be merged, and where they are
         scalars, assign from the highest-priority source where that attribute
         is non-null.
 
         Priority is NCIt > Mondo > OMIM > OncoTree> DO.
 
-        :param Set record_id_set: group of concept IDs
+        :param records: source records for each member of the concept group
         :return: completed merged drug object to be stored in DB, as well as
             a list of the IDs ultimately included in said record
         """
-        records = []
-        final_ids = []
-        for record_id in record_id_set:
-            record = self._database.get_record_by_id(record_id)
-            if record:
-                records.append(record)
-                final_ids.append(record["concept_id"])
-            else:
-                _logger.error(
-                    "generate_merged_record could not retrieve record for %s in %s",
-                    record_id,
-                    record_id_set,
-                )
-
-        def record_order(record: dict) -> tuple:
-            """Provide priority values of concepts for sort function."""
-            src = record["src_name"].upper()
-            source_rank = SourcePriority[src].value
-            return source_rank, record["concept_id"]
-
-        records.sort(key=record_order)
-
-        merged_properties = {
-            "concept_id": records[0]["concept_id"],
-            "aliases": set(),
-            "associated_with": set(),
-        }
-        if len(records) > 1:
-            merged_properties["xrefs"] = list({r["concept_id"] for r in records[1:]})
+        final_ids = [record["concept_id"] for record in records]
 
         set_fields = ["aliases", "associated_with"]
         scalar_fields = ["label", "pediatric_disease", "oncologic_disease"]
+        merged_properties = {field: set() for field in set_fields}
+
+        # single pass: track the top-ranked record overall, and for each scalar, the
+        # top-ranked record with a non-null value
+        top_rank = None
+        scalar_values = {}  # field -> (rank, value)
         for record in records:
+            rank = self._record_order(record)
+            if top_rank is None or rank < top_rank:
+                top_rank = rank
+                merged_properties["concept_id"] = record["concept_id"]
             for field in set_fields:
-                if field in record:
-                    merged_properties[field] |= set(record[field])
+                merged_properties[field].update(record.get(field) or ())
             for field in scalar_fields:
-                if field not in merged_properties and field in record:
-                    merged_properties[field] = record[field]
+                value = record.get(field)
+                if value is not None and (
+                    field not in scalar_values or rank < scalar_values[field][0]
+                ):
+                    scalar_values[field] = (rank, value)
+
+        for field, (_, value) in scalar_values.items():
+            merged_properties[field] = value
+        if len(records) > 1:
+            concept_id = merged_properties["concept_id"]
+            merged_properties["xrefs"] = [i for i in final_ids if i != concept_id]
 
         for field in set_fields:
             field_value = merged_properties[field]
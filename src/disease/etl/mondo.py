@@ -1,8 +1,10 @@
 """Get Mondo Disease Ontology data."""
 
 import logging
-import re
 from collections import defaultdict
+from collections.abc import Generator
+from functools import cache
+from types import MappingProxyType
 from typing import ClassVar
 
 import fastobo
@@ -13,6 +15,29 @@ from disease.schemas import DataLicenseAttributes, NamespacePrefix, SourceMeta
 
 _logger = logging.getLogger(__name__)
 
+_SKOS_EXACT_MATCH = fastobo.id.PrefixedIdent("skos", "exactMatch")
+
+# xrefs to these sources are normalizable; all others go under associated_with
+_XREF_PREFIXES = frozenset(
+    (
+        NamespacePrefix.OMIM,
+        NamespacePrefix.NCIT,
+        NamespacePrefix.DO,
+        NamespacePrefix.ONCOTREE,
+    )
+)
+
+# namespace prefix -> (CURIE prefix, record field) for Mondo xrefs
+_XREF_DISPATCH = MappingProxyType(
+    {
+        prefix: (
+            prefix.value,
+            "xrefs" if prefix in _XREF_PREFIXES else "associated_with",
+        )
+        for prefix in NamespacePrefix
+    }
+)
+
 
 class Mondo(Base):
     """Gather and load data from Mondo."""
@@ -32,7 +57,10 @@ class Mondo(Base):
         self._database.add_source_metadata(self._src_name, metadata)
 
     def _construct_dependency_set(self, dag: defaultdict, parent: str) -> set[str]:
-        """Recursively get all children concepts for a term
+        """Get all children concepts for a term
+
+        Terms can have multiple parents, so each is visited once rather than once per
+        path from ``parent``.
 
         :param dag: dictionary where keys are ontology terms and values are lists of
             terms with ``is_a`` relationships to the parent
@@ -40,38 +68,47 @@ class Mondo(Base):
         :return: Set of children concepts
         """
         children = {parent}
-        for child in dag[parent]:
-            children |= self._construct_dependency_set(dag, child)
+        stack = [parent]
+        while stack:
+            for child in dag.get(stack.pop(), []):
+                if child not in children:
+                    children.add(child)
+                    stack.append(child)
         return children
 
-    _identifiers_url_pattern = r"http://identifiers.org/(.*)/(.*)"
-    _lui_patterns: ClassVar = [
-        # (NamespacePrefix.OMIMPS, r"https://omim.org/phenotypicSeries/(.*)"),
-        (NamespacePrefix.OMIM, r"https://omim.org/entry/(.*)"),
-        (NamespacePrefix.UMLS, r"http://linkedlifedata.com/resource/umls/id/(.*)"),
-        (NamespacePrefix.ICD10CM, r"http://purl.bioontology.org/ontology/ICD10CM/(.*)"),
-        (NamespacePrefix.ICD10, r"https://icd.who.int/browse10/2019/en#/(.*)"),
+    _identifiers_url_prefix = "http://identifiers.org/"
+    _lui_url_prefixes: ClassVar = [
+        # (NamespacePrefix.OMIMPS, "https://omim.org/phenotypicSeries/"),
+        (NamespacePrefix.OMIM, "https://omim.org/entry/"),
+        (NamespacePrefix.UMLS, "http://linkedlifedata.com/resource/umls/id/"),
+        (NamespacePrefix.ICD10CM, "http://purl.bioontology.org/ontology/ICD10CM/"),
+        (NamespacePrefix.ICD10, "https://icd.who.int/browse10/2019/en#/"),
     ]
 
-    def _get_xref_from_url(self, url: str) -> tuple[NamespacePrefix, str] | None:
+    @classmethod
+    @cache
+    def _get_xref_from_url(cls, url: str) -> tuple[NamespacePrefix, str] | None:
         """Extract prefix and LUI from URL reference.
 
+        The same URLs recur across many terms, so results are memoized (which also
+        means an unrecognized URL is only warned about once).
+
         :param url: url string given as URL xref property
         :return: prefix enum instance and LUI
         """
         if url.startswith("http://identifiers.org"):
-            match = re.match(self._identifiers_url_pattern, url)
-            if not match or not match.groups():
+            namespace, sep, local_id = url.removeprefix(
+                cls._identifiers_url_prefix
+            ).rpartition("/")
+            if not sep:
                 msg = f"Couldn't parse identifiers.org URL: {url}"
                 raise ValueError(msg)
-            if match.groups()[0] == "snomedct":
+            if namespace == "snomedct":
                 return None
-            prefix = NamespacePrefix[match.groups()[0].upper()]
-            return (prefix, match.groups()[1])
-        for prefix, pattern in self._lui_patterns:
-            match = re.match(pattern, url)
-            if match and match.groups():
-                return (prefix, match.groups()[0])
+            return (NamespacePrefix[namespace.upper()], local_id)
+        for prefix, url_prefix in cls._lui_url_prefixes:
+            if url.startswith(url_prefix):
+                return (prefix, url[len(url_prefix) :])
         # didn't match any patterns
         _logger.warning("Unrecognized URL for xref: %s", url)
         return None
@@ -115,9 +152,10 @@ class Mondo(Base):
         # so we can ignore other relations and any non-resource property values.
         # previously there may have been usage of mondo:equivalentTo but that seems to
         # be irrelevant for property values
-        if not isinstance(
-            property_value, fastobo.pv.ResourcePropertyValue
-        ) or property_value.relation != fastobo.id.PrefixedIdent("skos", "exactMatch"):
+        if (
+            not isinstance(property_value, fastobo.pv.ResourcePropertyValue)
+            or property_value.relation != _SKOS_EXACT_MATCH
+        ):
             return None
         if isinstance(property_value.value, fastobo.id.Url):
             xref_result = self._get_xref_from_url(str(property_value.value))
@@ -134,6 +172,26 @@ class Mondo(Base):
             return None
         return prefix, local_id
 
+    def _iter_xrefs(
+        self, frame: fastobo.term.TermFrame
+    ) -> Generator[tuple[str, str], None, None]:
+        """Yield normalized references from both xref and property value clauses.
+
+        :param frame: individual frame from OBO file
+        :return: Generator of (record field, normalized CURIE) pairs
+        """
+        for clause in frame:
+            if isinstance(clause, fastobo.term.XrefClause):
+                xref = self._get_xref_from_xref_clause(clause)
+            elif isinstance(clause, fastobo.term.PropertyValueClause):
+                xref = self._get_xref_from_pv_clause(clause)
+            else:
+                continue
+            if xref:
+                prefix, local_id = xref
+                curie_prefix, field = _XREF_DISPATCH[prefix]
+                yield field, f"{curie_prefix}:{local_id}"
+
     def _process_term_frame(self, frame: fastobo.term.TermFrame) -> dict:
         """Extract disease params from an OBO term frame.
 
@@ -147,39 +205,25 @@ class Mondo(Base):
             "associated_with": [],
         }
 
+        # dispatch on clause type rather than building a raw tag string per clause
         for clause in frame:
-            tag = clause.raw_tag()
-            if tag == "name":
-                params["label"] = clause.raw_value()
-            elif tag == "synonym":
+            if isinstance(clause, fastobo.term.NameClause):
+                # unlike raw_value(), `name` has OBO escapes (\", \{, \\ etc) removed
+                params["label"] = clause.name
+            elif isinstance(clause, fastobo.term.SynonymClause):
                 params["aliases"].append(clause.synonym.desc)
-            elif tag in ("xref", "property_value"):
-                if tag == "xref":
-                    xref = self._get_xref_from_xref_clause(clause)
-                else:
-                    xref = self._get_xref_from_pv_clause(clause)
-                if not xref:
-                    continue
-                prefix, local_id = xref
-
-                curie = f"{prefix.value}:{local_id}"
-                if prefix in (
-                    NamespacePrefix.OMIM,
-                    NamespacePrefix.NCIT,
-                    NamespacePrefix.DO,
-                    NamespacePrefix.ONCOTREE,
-                ):
-                    params["xrefs"].append(curie)
-                else:
-                    params["associated_with"].append(curie)
+        for field, xref in self._iter_xrefs(frame):
+            params[field].append(xref)
         return params
 
     def _transform_data(self) -> None:
         """Get data from file and send disease records to database."""
         reader = fastobo.iter(str(self._data_file.absolute()))
         dag = defaultdict(list)
+        frames = {}
         for item in reader:
             item_id = str(item.id)
+            frames[item_id] = item
             for clause in item:
                 if clause.raw_tag() == "is_a":
                     dag[clause.raw_value()].append(item_id)
@@ -191,18 +235,17 @@ class Mondo(Base):
         cancer_root = "MONDO:0045024"
         cancers = self._construct_dependency_set(dag, cancer_root)
 
-        reader = fastobo.iter(str(self._data_file.absolute()))
-        for item in tqdm(reader, ncols=80, disable=self._silent):
-            concept_id = str(item.id).lower()
-            if concept_id.upper() not in diseases:
+        for item_id in tqdm(diseases, ncols=80, disable=self._silent):
+            item = frames.get(item_id)
+            if item is None:
                 continue
 
             params = self._process_term_frame(item)
 
-            if concept_id.upper() in pediatric_diseases:
+            if item_id in pediatric_diseases:
                 params["pediatric_disease"] = True
 
-            if concept_id.upper() in cancers:
+            if item_id in cancers:
                 params["oncologic_disease"] = True
 
             self._load_disease(params)
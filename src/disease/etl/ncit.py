@@ -3,16 +3,23 @@
 import logging
 import re
 
-import owlready2 as owl
 from tqdm import tqdm
 
-from disease.etl.base import OWLBase
+from disease.etl.base import OBO_IN_OWL, OWLBase
 from disease.schemas import NamespacePrefix, SourceMeta, SourceName
 
 _logger = logging.getLogger(__name__)
 
 icdo_re = re.compile("[0-9]+/[0-9]+")
 
+THESAURUS = "http://ncicb.nci.nih.gov/xml/owl/EVS/Thesaurus.owl#"
+
+_NCIT_PREFIX = f"{NamespacePrefix.NCIT.value}:"
+_UMLS_PREFIX = f"{NamespacePrefix.UMLS.value}:"
+_ICDO_PREFIX = f"{NamespacePrefix.ICDO.value}:"
+_IMDRF_PREFIX = f"{NamespacePrefix.IMDRF.value}:"
+_SRC_NAME = SourceName.NCIT.value
+
 
 class NCIt(OWLBase):
     """Gather and load data from NCIt."""
@@ -40,49 +47,47 @@ class NCIt(OWLBase):
         :return: uq_nodes with additions from above types added
         :rtype: Set[str]
         """
-        graph = owl.default_world.as_rdflib_graph()
-        p106 = "http://ncicb.nci.nih.gov/xml/owl/EVS/Thesaurus.owl#P106"
-        neopl = self._get_by_property_value(p106, "Neoplastic Process", graph)
-        dos = self._get_by_property_value(p106, "Disease or Syndrome", graph)
-        p310 = "http://ncicb.nci.nih.gov/xml/owl/EVS/Thesaurus.owl#P310"
-        retired = self._get_by_property_value(p310, "Retired_Concept", graph)
-        return neopl.union(dos) - retired
+        # semantic types and retirement status resolved in one pass over the quadstore
+        query = f"""
+            SELECT DISTINCT ?c WHERE {{
+                VALUES ?v {{ "Neoplastic Process" "Disease or Syndrome" }}
+                ?c <{THESAURUS}P106> ?v .
+                FILTER NOT EXISTS {{ ?c <{THESAURUS}P310> "Retired_Concept" }}
+            }}
+            """
+        return {entity.iri for (entity,) in self._world.sparql(query)}
 
     def _transform_data(self) -> None:
         """Get data from file and construct object for loading."""
-        ncit = owl.get_ontology(self._data_file.absolute().as_uri()).load()
+        self._load_ontology()
         disease_uris = self._get_disease_classes()
+        labels = self._get_property_values(THESAURUS + "P108")
+        synonyms = self._get_property_values(THESAURUS + "P90")
+        umls_cuis = self._get_property_values(THESAURUS + "P207")
+        maps_to = self._get_property_values(THESAURUS + "P375")
+        db_xrefs = self._get_property_values(OBO_IN_OWL + "hasDbXref")
         for uri in tqdm(disease_uris, ncols=80, disable=self._silent):
-            disease_class = ncit.search(iri=uri)[0]
-            concept_id = f"{NamespacePrefix.NCIT.value}:{disease_class.name}"
-            if disease_class.P108:
-                label = disease_class.P108.first()
+            concept_id = _NCIT_PREFIX + uri.split("#")[-1]
+            if uri in labels:
+                label = labels[uri][0]
             else:
                 _logger.warning("No label for concept %s", concept_id)
                 continue
-            aliases = [a for a in disease_class.P90 if a != label]
+            aliases = [a for a in synonyms.get(uri, []) if a != label]
 
             associated_with = []
-            if disease_class.P207:
-                associated_with.append(
-                    f"{NamespacePrefix.UMLS.value}:" f"{disease_class.P207.first()}"
-                )
-            maps_to = disease_class.P375
-            if maps_to:
-                icdo_list = list(filter(lambda s: icdo_re.match(s), maps_to))
-                if len(icdo_list) == 1:
-                    associated_with.append(
-                        f"{NamespacePrefix.ICDO.value}:" f"{icdo_list[0]}"
-                    )
-            imdrf = disease_class.hasDbXref
-            if imdrf:
-                associated_with.append(
-                    f"{NamespacePrefix.IMDRF.value}:" f"{imdrf[0].split(':')[1]}"
-                )
+            if uri in umls_cuis:
+                associated_with.append(_UMLS_PREFIX + umls_cuis[uri][0])
+            if uri in maps_to:
+                icdo_codes = {s for s in maps_to[uri] if icdo_re.match(s)}
+                if len(icdo_codes) == 1:
+                    associated_with.append(_ICDO_PREFIX + icdo_codes.pop())
+            if uri in db_xrefs:
+                associated_with.append(_IMDRF_PREFIX + db_xrefs[uri][0].split(":")[1])
 
             disease = {
                 "concept_id": concept_id,
-                "src_name": SourceName.NCIT.value,
+                "src_name": _SRC_NAME,
                 "label": label,
                 "aliases": aliases,
                 "associated_with": associated_with,
@@ -8,6 +8,11 @@ from wags_tails import CustomData, DataSource
 from disease.etl.base import Base
 from disease.schemas import NamespacePrefix, SourceMeta
 
+# MIM prefixes for gene entries (Asterisk, Plus) and moved/removed entries (Caret)
+_SKIPPED_ROW_TYPES = frozenset(("Asterisk", "Caret", "Plus"))
+
+_OMIM_PREFIX = f"{NamespacePrefix.OMIM.value}:"
+
 
 class OMIM(Base):
     """Gather and load data from OMIM."""
@@ -59,32 +64,20 @@ class OMIM(Base):
     def _transform_data(self) -> None:
         """Modulate data and prepare for loading."""
         with self._data_file.open() as f:
-            rows = f.readlines()
-        rows = [r.rstrip() for r in rows if not r.startswith("#")]
-        rows = [r.split("\t") for r in rows]
-        rows = [r for r in rows if r[0] not in ("Asterisk", "Caret", "Plus")]
-        for row in tqdm(rows, ncols=80, disable=self._silent):
-            disease = {
-                "concept_id": f"{NamespacePrefix.OMIM.value}:{row[1]}",
-            }
-            aliases = set()
-
-            label_item = row[2]
-            if ";" in label_item:
-                label_split = label_item.split(";")
-                disease["label"] = label_split[0]
-                aliases.add(label_split[1])
-            else:
-                disease["label"] = row[2]
-
-            if len(row) > 3:
-                aliases |= {t for t in row[3].split(";") if t}
-            if len(row) > 4:
-                aliases |= {t for t in row[4].split(";") if t}
-            aliases = {
-                alias[:-10] if alias.endswith(", INCLUDED") else alias
-                for alias in aliases
-            }
-            disease["aliases"] = [a.lstrip() for a in aliases]
-
-            self._load_disease(disease)
+            rows = (r.rstrip().split("\t") for r in f if not r.startswith("#"))
+            for row in tqdm(rows, ncols=80, disable=self._silent):
+                if row[0] in _SKIPPED_ROW_TYPES:
+                    continue
+                disease = {"concept_id": _OMIM_PREFIX + row[1]}
+
+                # preferred title, optionally followed by the disease symbol
+                disease["label"], sep, symbols = row[2].partition(";")
+                titles = [symbols.partition(";")[0]] if sep else []
+                # alternative titles and included titles
+                for column in row[3:5]:
+                    titles.extend(column.split(";"))
+                disease["aliases"] = [
+                    t.removesuffix(", INCLUDED").lstrip() for t in titles if t
+                ]
+
+                self._load_disease(disease)
@@ -10,6 +10,10 @@ from disease.schemas import NamespacePrefix, SourceMeta
 
 _logger = logging.getLogger(__name__)
 
+_ONCOTREE_PREFIX = f"{NamespacePrefix.ONCOTREE.value}:"
+_UMLS_PREFIX = f"{NamespacePrefix.UMLS.value}:"
+_NCIT_PREFIX = f"{NamespacePrefix.NCIT.value}:"
+
 
 class OncoTree(Base):
     """Gather and load data from OncoTree."""
@@ -33,19 +37,18 @@ class OncoTree(Base):
     def _traverse_tree(self, disease_node: dict) -> None:
         """Traverse JSON tree and queue diseases for loading where possible.
 
-        :param disease_node: node in tree containing info for individual disease.
+        :param disease_node: root node of tree, containing info for individual disease.
         """
-        if disease_node["level"] >= 2:
-            self._nodes.append(
-                {
-                    "code": disease_node["code"],
-                    "name": disease_node["name"],
-                    "externalReferences": disease_node.get("externalReferences", []),
-                }
-            )
-        if disease_node.get("children"):
-            for child in disease_node["children"].values():
-                self._traverse_tree(child)
+        stack = [disease_node]
+        while stack:
+            node = stack.pop()
+            if node["level"] >= 2:
+                # queue the node itself -- _add_disease only reads from it
+                self._nodes.append(node)
+            children = node.get("children")
+            if children:
+                # reversed, so nodes are still queued in depth-first pre-order
+                stack.extend(reversed(children.values()))
 
     def _add_disease(self, disease_node: dict) -> None:
         """Grab data from disease node and load into DB.
@@ -53,24 +56,18 @@ class OncoTree(Base):
         :param disease_node: individual node taken from OncoTree tree
         """
         disease = {
-            "concept_id": f"{NamespacePrefix.ONCOTREE.value}:{disease_node['code']}",
+            "concept_id": _ONCOTREE_PREFIX + disease_node["code"],
             "label": disease_node["name"],
             "xrefs": [],
             "associated_with": [],
             "oncologic_disease": True,
         }
-        refs = disease_node.get("externalReferences", [])
+        refs = disease_node.get("externalReferences", {})
         for prefix, codes in refs.items():
             if prefix == "UMLS":
-                normed_prefix = NamespacePrefix.UMLS.value
-                for code in codes:
-                    normed_id = f"{normed_prefix}:{code}"
-                    disease["associated_with"].append(normed_id)
+                disease["associated_with"].extend(_UMLS_PREFIX + c for c in codes)
             elif prefix == "NCI":
-                normed_prefix = NamespacePrefix.NCIT.value
-                for code in codes:
-                    normed_id = f"{normed_prefix}:{code}"
-                    disease["xrefs"].append(normed_id)
+                disease["xrefs"].extend(_NCIT_PREFIX + c for c in codes)
             else:
                 _logger.warning("Unrecognized prefix: %s", prefix)
                 continue
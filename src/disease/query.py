@@ -31,6 +31,9 @@ from disease.schemas import (
 
 _logger = logging.getLogger(__name__)
 
+# str.startswith() accepts a tuple, which checks every prefix in a single C call
+_SOURCE_PREFIXES = tuple(PREFIX_LOOKUP)
+
 
 class InvalidParameterException(Exception):  # noqa: N818
     """Exception for invalid parameter args provided by the user."""
@@ -159,7 +162,7 @@ class QueryHandler:
             sources
         """
         concept_id_items = []
-        if [p for p in PREFIX_LOOKUP if query.startswith(p)]:
+        if query.startswith(_SOURCE_PREFIXES):
             record = self.db.get_record_by_id(query, False)
             if record:
                 concept_id_items.append(record)
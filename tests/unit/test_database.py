@@ -4,6 +4,7 @@ import os
 
 import pytest
 
+from disease.database.database import DatabaseReadException, DatabaseWriteException
 from disease.schemas import RecordType
 
 IS_DDB = not os.environ.get("DISEASE_NORM_DB_URL", "").lower().startswith("postgres")
@@ -63,6 +64,112 @@ def test_item_type(database):
     assert item["item_type"] == "merger"
 
 
+def test_get_records_by_ids(database):
+    """Check that multiple records are retrieved at once."""
+    records = database.get_records_by_ids(
+        ["ncit:C2926", "mondo:0005233", "DOID:3908", "ncit:C000000"]
+    )
+    assert set(records) == {"ncit:C2926", "mondo:0005233", "DOID:3908"}
+    assert records["ncit:C2926"]["concept_id"] == "ncit:C2926"
+    assert records["ncit:C2926"]["label"] == "Lung Non-Small Cell Carcinoma"
+    assert records["mondo:0005233"]["src_name"] == "Mondo"
+    assert "label_and_type" not in records["DOID:3908"]
+
+    # lookups are case-sensitive on every backend
+    assert database.get_records_by_ids(["NCIT:C2926", "ncit:c2926"]) == {}
+
+    assert database.get_records_by_ids([]) == {}
+
+
+@pytest.mark.skipif(IS_DDB, reason="only applies to PostgreSQL in test env")
+def test_get_records_by_ids_case(database):
+    """Check that PostgreSQL only keeps exact matches from its case-insensitive index."""
+    records = database.get_records_by_ids(["NCIT:C2926", "ncit:C2926", "doid:3908"])
+    assert list(records) == ["ncit:C2926"]
+    assert database.get_record_by_id("NCIT:C2926")["concept_id"] == "ncit:C2926"
+
+
+@pytest.mark.skipif(not IS_DDB, reason="only applies to DynamoDB in test env")
+def test_get_records_by_ids_unprocessed(database, monkeypatch):
+    """Check that keys left unprocessed are retried a limited number of times."""
+    calls = []
+
+    def batch_get_item(RequestItems):  # noqa: N803
+        calls.append(RequestItems)
+        return {"Responses": {}, "UnprocessedKeys": RequestItems}
+
+    monkeypatch.setattr(database.dynamodb, "batch_get_item", batch_get_item)
+    monkeypatch.setattr("disease.database.dynamodb.time.sleep", lambda _: None)
+    with pytest.raises(DatabaseReadException):
+        database.get_records_by_ids(["ncit:C2926"])
+    assert 1 < len(calls) < 100
+
+
+@pytest.mark.skipif(not IS_DDB, reason="PostgreSQL can't overwrite merged records")
+def test_add_merged_records(database):
+    """Check that many merged records are written at once."""
+    concept_ids = ["ncit:C2926", "ncit:C35424"]
+    originals = [database.get_record_by_id(i, merge=True) for i in concept_ids]
+    try:
+        database.add_merged_records(
+            [{**record, "label": "updated label"} for record in originals]
+        )
+        database.complete_write_transaction()
+        for concept_id in concept_ids:
+            record = database.get_record_by_id(concept_id, merge=True)
+            assert record["label"] == "updated label"
+    finally:
+        database.add_merged_records([dict(record) for record in originals])
+        database.complete_write_transaction()
+    for concept_id, original in zip(concept_ids, originals, strict=True):
+        assert database.get_record_by_id(concept_id, merge=True) == original
+
+
+def _get_merge_refs(database, concept_ids):
+    """Get current merge refs for records, lowercased as DynamoDB stores them."""
+    records = database.get_records_by_ids(concept_ids)
+    return {i: records[i]["merge_ref"].lower() for i in concept_ids}
+
+
+def test_update_merge_refs(database):
+    """Check that merge refs of many records are updated at once."""
+    concept_ids = ["ncit:C2926", "mondo:0005233"]
+    original_refs = _get_merge_refs(database, concept_ids)
+    try:
+        database.update_merge_refs(dict.fromkeys(concept_ids, "ncit:C35424"))
+        database.complete_write_transaction()
+        assert _get_merge_refs(database, concept_ids) == dict.fromkeys(
+            concept_ids, "ncit:c35424"
+        )
+    finally:
+        database.update_merge_refs(original_refs)
+        database.complete_write_transaction()
+    assert _get_merge_refs(database, concept_ids) == original_refs
+
+
+def test_update_merge_refs_missing(database):
+    """Check that updates to nonexistent records are reported together, without
+    blocking updates to records that do exist.
+    """
+    original_refs = _get_merge_refs(database, ["ncit:C2926"])
+    try:
+        with pytest.raises(DatabaseWriteException):
+            database.update_merge_refs(
+                {
+                    "ncit:C2926": "ncit:C35424",
+                    "ncit:C000000": "ncit:C35424",
+                    "DOID:000000": "ncit:C35424",
+                }
+            )
+        database.complete_write_transaction()
+        assert _get_merge_refs(database, ["ncit:C2926"]) == {
+            "ncit:C2926": "ncit:c35424"
+        }
+    finally:
+        database.update_merge_refs(original_refs)
+        database.complete_write_transaction()
+
+
 @pytest.mark.skipif(not IS_TEST_ENV, reason="not in test environment")
 def database(db_fixture):
     """Perform basic test of get_all_records method.
@@ -260,32 +260,156 @@ def test_generate_merged_record(
     mafd2,
 ):
     """Test generation of individual merged record."""
+
+    def get_records(concept_ids):
+        return list(merge_instance._database.get_records_by_ids(concept_ids).values())
+
     neuroblastoma_ids = record_id_groups["neuroblastoma"]
-    response, r_ids = merge_instance._generate_merged_record(neuroblastoma_ids)
+    response, r_ids = merge_instance._generate_merged_record(
+        get_records(neuroblastoma_ids)
+    )
     assert set(r_ids) == set(neuroblastoma_ids)
     compare_merged_records(response, neuroblastoma)
 
     lnscc_ids = record_id_groups["lnscc"]
-    response, r_ids = merge_instance._generate_merged_record(lnscc_ids)
+    response, r_ids = merge_instance._generate_merged_record(get_records(lnscc_ids))
     assert set(r_ids) == set(lnscc_ids)
     compare_merged_records(response, lnscc)
 
     richter_ids = record_id_groups["richter"]
-    response, r_ids = merge_instance._generate_merged_record(richter_ids)
+    response, r_ids = merge_instance._generate_merged_record(get_records(richter_ids))
     assert set(r_ids) == set(richter_ids)
     compare_merged_records(response, richter)
 
     ped_liposarcoma_ids = record_id_groups["ped_liposarcoma"]
-    response, r_ids = merge_instance._generate_merged_record(ped_liposarcoma_ids)
+    response, r_ids = merge_instance._generate_merged_record(
+        get_records(ped_liposarcoma_ids)
+    )
     assert set(r_ids) == set(ped_liposarcoma_ids)
     compare_merged_records(response, ped_liposarcoma)
 
     teratoma_ids = record_id_groups["teratoma"]
-    response, r_ids = merge_instance._generate_merged_record(teratoma_ids)
+    response, r_ids = merge_instance._generate_merged_record(get_records(teratoma_ids))
     assert set(r_ids) == set(teratoma_ids)
     compare_merged_records(response, teratoma)
 
     mafd2_ids = record_id_groups["mafd2"]
-    response, r_ids = merge_instance._generate_merged_record(mafd2_ids)
+    response, r_ids = merge_instance._generate_merged_record(get_records(mafd2_ids))
     assert set(r_ids) == {"mondo:0010648", "MIM:309200"}
     compare_merged_records(response, mafd2)
+
+
+class _StubDatabase:
+    """Capture merge output in place of a real database."""
+
+    def __init__(self, records: dict[str, dict]) -> None:
+        self.records = records
+        self.merged_records = []
+        self.merge_refs = {}
+
+    def get_records_by_ids(self, concept_ids):
+        return {i: dict(self.records[i]) for i in concept_ids if i in self.records}
+
+    def add_merged_records(self, merged_records):
+        self.merged_records = list(merged_records)
+
+    def update_merge_refs(self, merge_refs):
+        self.merge_refs = dict(merge_refs)
+
+    def complete_write_transaction(self):
+        pass
+
+
+def test_build_groups():
+    """Test that each Mondo seed gets its own, possibly overlapping, concept group."""
+    records = {
+        "mondo:0000001": {
+            "concept_id": "mondo:0000001",
+            "src_name": "Mondo",
+            "xrefs": ["DOID:1"],
+        },
+        "mondo:0000002": {
+            "concept_id": "mondo:0000002",
+            "src_name": "Mondo",
+            "xrefs": ["DOID:1", "oncotree:ONE"],
+        },
+        "DOID:1": {"concept_id": "DOID:1", "src_name": "DO"},
+        "oncotree:ONE": {"concept_id": "oncotree:ONE", "src_name": "OncoTree"},
+    }
+    database = _StubDatabase(records)
+    merge = Merge(database)
+    merge.create_merged_concepts(["mondo:0000002", "mondo:0000003", "mondo:0000001"])
+
+    # missing seeds are skipped, and groups are visited in seed priority order
+    assert merge._groups == [
+        ("mondo:0000001", {"mondo:0000001", "DOID:1"}),
+        ("mondo:0000002", {"mondo:0000002", "DOID:1", "oncotree:ONE"}),
+    ]
+    assert sorted(r["concept_id"] for r in database.merged_records) == [
+        "mondo:0000001",
+        "mondo:0000002",
+    ]
+    # the shared xref refers to the merged record of the first seed
+    assert database.merge_refs == {
+        "mondo:0000001": "mondo:0000001",
+        "mondo:0000002": "mondo:0000002",
+        "DOID:1": "mondo:0000001",
+        "oncotree:ONE": "mondo:0000002",
+    }
+
+
+def test_shared_xrefs():
+    """Test merging of Mondo records that share xrefs."""
+    records = {
+        "mondo:0000001": {
+            "concept_id": "mondo:0000001",
+            "src_name": "Mondo",
+            "label": "disease one",
+            "xrefs": ["ncit:C1"],
+        },
+        "mondo:0000002": {
+            "concept_id": "mondo:0000002",
+            "src_name": "Mondo",
+            "label": "disease two",
+            "xrefs": ["ncit:C1", "DOID:1"],
+        },
+        "mondo:0000003": {
+            "concept_id": "mondo:0000003",
+            "src_name": "Mondo",
+            "label": "disease three",
+            "xrefs": ["DOID:1"],
+        },
+        "ncit:C1": {"concept_id": "ncit:C1", "src_name": "NCIt", "label": "c1"},
+        "DOID:1": {"concept_id": "DOID:1", "src_name": "DO", "label": "doid one"},
+    }
+
+    database = _StubDatabase(records)
+    # submit in reverse to check that conflicts don't depend on input order
+    Merge(database).create_merged_concepts(
+        ["mondo:0000003", "mondo:0000002", "mondo:0000001"]
+    )
+
+    # one merged record per merged concept ID: Mondo seeds are only merged with each
+    # other when their groups resolve to the same top-ranked concept
+    merged_ids = {
+        r["concept_id"]: {r["concept_id"], *r.get("xrefs", [])}
+        for r in database.merged_records
+    }
+    assert len(merged_ids) == len(database.merged_records)
+    assert merged_ids == {
+        "ncit:C1": {"ncit:C1", "mondo:0000001", "mondo:0000002", "DOID:1"},
+        "mondo:0000003": {"mondo:0000003", "DOID:1"},
+    }
+
+    # shared members point at the merged record of the highest-priority seed
+    assert database.merge_refs == {
+        "mondo:0000001": "ncit:C1",
+        "mondo:0000002": "ncit:C1",
+        "mondo:0000003": "mondo:0000003",
+        "ncit:C1": "ncit:C1",
+        "DOID:1": "ncit:C1",
+    }
+
+    # every merge ref points at a merged record that lists the referring concept
+    for concept_id, merge_ref in database.merge_refs.items():
+        assert concept_id in merged_ids[merge_ref]
@@ -2,6 +2,7 @@
 
 import re
 
+import fastobo
 import pytest
 
 from disease.etl.mondo import Mondo
@@ -289,3 +290,15 @@ def test_meta(mondo):
     assert not response.source_meta_.data_license_attributes.non_commercial
     assert not response.source_meta_.data_license_attributes.share_alike
     assert response.source_meta_.data_license_attributes.attribution
+
+
+def test_escaped_label(database):
+    """Test that OBO escapes are removed from term names."""
+    doc = fastobo.loads(
+        "format-version: 1.4\n\n"
+        "[Term]\n"
+        "id: MONDO:0000000\n"
+        'name: disease \\{with\\} \\"escapes\\" and a \\\\ backslash\n'
+    )
+    params = Mondo(database)._process_term_frame(next(iter(doc)))
+    assert params["label"] == 'disease {with} "escapes" and a \\ backslash'
@@ -1,10 +1,12 @@
 """Test NCIt source."""
 
 import re
+import shutil
+from pathlib import Path
 
 import pytest
 
-from disease.etl.ncit import NCIt
+from disease.etl.ncit import THESAURUS, NCIt
 from disease.schemas import Disease, MatchType
 
 
@@ -142,3 +144,26 @@ def test_meta(ncit):
     assert not response.source_meta_.data_license_attributes.non_commercial
     assert not response.source_meta_.data_license_attributes.share_alike
     assert response.source_meta_.data_license_attributes.attribution
+
+
+def test_moved_quadstore(database, tmp_path):
+    """Test that a quadstore copied along with its data file isn't loaded twice."""
+    data_file = Path(__file__).parents[1] / "data" / "ncit" / "ncit_23.06d.owl"
+    (tmp_path / "a").mkdir()
+    shutil.copy2(data_file, tmp_path / "a")
+    icdo_query = f"SELECT ?c ?v WHERE {{ ?c <{THESAURUS}P375> ?v . }}"
+
+    ncit = NCIt(database, tmp_path)
+    ncit._data_file = tmp_path / "a" / data_file.name
+    ncit._load_ontology()
+    expected = len(list(ncit._world.sparql(icdo_query)))
+    ncit._world.close()
+    assert expected
+
+    shutil.copytree(tmp_path / "a", tmp_path / "b")
+    ncit._data_file = tmp_path / "b" / data_file.name
+    ncit._load_ontology()
+    try:
+        assert len(list(ncit._world.sparql(icdo_query))) == expected
+    finally:
+        ncit._world.close()